@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 
@@ -77,25 +78,59 @@ class TeamGameFeatures:
     feature_columns: Tuple[str, ...]
 
 
-def _parse_team(matchup: str) -> str:
-    return matchup.split(" ")[0]
+def _split_matchups(matchups: pd.Series) -> pd.DataFrame:
+    """Split ``MATCHUP`` strings such as ``"TOR vs. MIL"`` or ``"TOR @ BOS"``.
+
+    Returns a dataframe with the team, separator and opponent in columns
+    ``0``, ``1`` and ``2`` respectively.
+    """
+
+    parts = matchups.str.split(" ", n=2, expand=True).reindex(columns=range(3))
+    invalid = (
+        ~parts[1].isin(["vs.", "@"])
+        | parts[0].fillna("").eq("")
+        | parts[2].fillna("").eq("")
+    )
+    if invalid.any():
+        raise ValueError(
+            f"Unrecognised matchup format: {matchups[invalid].iloc[0]!r}"
+        )
+    return parts
+
+
+def _read_player_log_csv(
+    csv_path: Path | str, chunksize: int | None, **read_options
+) -> pd.DataFrame:
+    """Read a player log CSV in one go or ``chunksize`` rows at a time."""
+
+    if chunksize is None:
+        return pd.read_csv(csv_path, **read_options)
+    chunks = list(pd.read_csv(csv_path, chunksize=chunksize, **read_options))
+    return pd.concat(chunks, ignore_index=True)
 
 
-def _parse_opponent(matchup: str) -> str:
-    if "vs." in matchup:
-        return matchup.split("vs. ")[-1]
-    if "@" in matchup:
-        return matchup.split("@ ")[-1]
-    raise ValueError(f"Unrecognised matchup format: {matchup!r}")
+def _coerce_float32(stats: pd.DataFrame) -> pd.DataFrame:
+    """Convert stat columns to float32, mapping unparseable values to NaN."""
 
+    return stats.apply(pd.to_numeric, errors="coerce").astype("float32")
 
-def load_player_logs(csv_path: Path | str) -> pd.DataFrame:
-    """Load raw player game logs from a CSV file.
+
+def load_player_logs(
+    csv_path: Path | str, *, chunksize: int | None = None
+) -> pd.DataFrame:
+    """Load raw player game logs from a CSV or Parquet file.
 
     Parameters
     ----------
     csv_path:
-        Path to the CSV export containing player game logs.
+        Path to the CSV export containing player game logs. Paths ending in
+        ``.parquet`` are read with :func:`pandas.read_parquet` instead, which
+        skips CSV parsing entirely; the columns are normalised to the same
+        types as the CSV path.
+    chunksize:
+        Optional number of rows to parse at a time. Useful for very large
+        multi-season CSV exports where parsing the whole file at once would
+        spike memory usage. Ignored for Parquet input.
 
     Returns
     -------
@@ -104,16 +139,41 @@ def load_player_logs(csv_path: Path | str) -> pd.DataFrame:
         ``TEAM_ABBREVIATION``, ``OPPONENT_ABBREVIATION`` and ``HOME``.
     """
 
-    df = pd.read_csv(csv_path, header=None, names=PLAYER_LOG_COLUMNS)
+    numeric_columns = [*TEAM_SUM_COLUMNS, *TEAM_MEAN_COLUMNS]
 
+    read_options = dict(
+        header=None,
+        names=PLAYER_LOG_COLUMNS,
+        converters={"MATCHUP": str},
+    )
+    # Declaring the numeric dtypes up front lets the parser produce the final
+    # float32 columns directly instead of inferring and coercing afterwards.
+    float_dtypes = {column: "float32" for column in numeric_columns}
+    if Path(csv_path).suffix == ".parquet":
+        df = pd.read_parquet(csv_path, columns=list(PLAYER_LOG_COLUMNS))
+        # A Parquet copy of the raw export may still hold stats as strings, so
+        # normalise them to the same types the CSV path produces.
+        df["MATCHUP"] = df["MATCHUP"].astype(str)
+        df[numeric_columns] = _coerce_float32(df[numeric_columns])
+    else:
+        try:
+            df = _read_player_log_csv(
+                csv_path, chunksize, dtype=float_dtypes, **read_options
+            )
+        except ValueError:
+            # A non-numeric token (e.g. "-") in a stat column: parse the stats
+            # as text and turn unparseable values into NaN instead of failing.
+            df = _read_player_log_csv(csv_path, chunksize, **read_options)
+            df[numeric_columns] = _coerce_float32(df[numeric_columns])
+
+    # Converted after reading rather than via ``parse_dates``: read_csv quietly
+    # leaves unparseable dates as strings, while to_datetime raises on them.
     df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"])
 
-    for column in TEAM_SUM_COLUMNS + list(TEAM_MEAN_COLUMNS) + ["PLUS_MINUS"]:
-        df[column] = pd.to_numeric(df[column], errors="coerce")
-
-    df["TEAM_ABBREVIATION"] = df["MATCHUP"].apply(_parse_team)
-    df["OPPONENT_ABBREVIATION"] = df["MATCHUP"].apply(_parse_opponent)
-    df["HOME"] = df["MATCHUP"].str.contains("vs.")
+    matchup_parts = _split_matchups(df["MATCHUP"])
+    df["TEAM_ABBREVIATION"] = matchup_parts[0]
+    df["OPPONENT_ABBREVIATION"] = matchup_parts[2]
+    df["HOME"] = matchup_parts[1].eq("vs.").astype(np.int8)
     df["WIN"] = (df["WL"] == "W").astype(int)
 
     return df
@@ -128,13 +188,6 @@ def prepare_team_game_features(player_logs: pd.DataFrame) -> TeamGameFeatures:
     depth during the matchup.
     """
 
-    aggregation = {
-        **{column: "sum" for column in TEAM_SUM_COLUMNS},
-        **{column: "mean" for column in TEAM_MEAN_COLUMNS},
-        "PLAYER_NAME": "count",
-        "GAME_DATE": "first",
-    }
-
     group_columns = [
         "GAME_ID",
         "TEAM_ABBREVIATION",
@@ -143,11 +196,34 @@ def prepare_team_game_features(player_logs: pd.DataFrame) -> TeamGameFeatures:
         "WIN",
     ]
 
+    # Group on categorical team codes so keys hash as integers, aggregate in
+    # encounter order and sort the (much smaller) result afterwards instead of
+    # having pandas sort the group keys of the full player log frame. Both team
+    # columns share one categorical dtype so their codes are comparable.
+    team_codes = pd.CategoricalDtype(
+        np.union1d(
+            player_logs["TEAM_ABBREVIATION"].unique(),
+            player_logs["OPPONENT_ABBREVIATION"].unique(),
+        )
+    )
+    group_keys = [
+        player_logs[column].astype(team_codes)
+        if column in ("TEAM_ABBREVIATION", "OPPONENT_ABBREVIATION")
+        else player_logs[column]
+        for column in group_columns
+    ]
+    grouped = player_logs.groupby(group_keys, sort=False, observed=True)
     team_games = (
-        player_logs.groupby(group_columns, as_index=False).agg(aggregation)
+        grouped.agg(
+            **{column: (column, "sum") for column in TEAM_SUM_COLUMNS},
+            **{column: (column, "mean") for column in TEAM_MEAN_COLUMNS},
+            PLAYER_COUNT=("PLAYER_NAME", "size"),
+            GAME_DATE=("GAME_DATE", "first"),
+        )
+        .sort_index()
+        .reset_index()
     )
 
-    team_games = team_games.rename(columns={"PLAYER_NAME": "PLAYER_COUNT"})
     feature_columns = tuple(
         column
         for column in team_games.columns
@@ -174,6 +250,12 @@ def prepare_team_game_features(player_logs: pd.DataFrame) -> TeamGameFeatures:
     ]
     team_games = team_games[ordered_columns]
 
+    # Counting stats fit comfortably in float32, halving the memory touched by
+    # every downstream pass. Team codes stay categorical from the groupby keys.
+    team_games[list(feature_columns)] = team_games[list(feature_columns)].astype(
+        "float32"
+    )
+
     return TeamGameFeatures(data=team_games, feature_columns=feature_columns)
 
 
@@ -196,39 +278,54 @@ def build_matchup_dataset(team_games: TeamGameFeatures) -> Tuple[pd.DataFrame, T
     df = team_games.data
     feature_columns = team_games.feature_columns
 
-    opponent_df = df.rename(
-        columns={
-            "TEAM_ABBREVIATION": "OPPONENT_ABBREVIATION",
-            "OPPONENT_ABBREVIATION": "TEAM_ABBREVIATION",
-            "HOME": "OPPONENT_HOME",
-            "WIN": "OPPONENT_WIN",
-        }
-    )
+    # Only games where both teams are present can be turned into matchups. A
+    # stable sort keeps the two rows of each game adjacent (and in their
+    # original order) so the feature block can be viewed as game pairs.
+    pair_sizes = df.groupby("GAME_ID")["GAME_ID"].transform("size")
+    paired = df[pair_sizes == 2].sort_values("GAME_ID", kind="stable")
+
+    # Compare integer category codes when both team columns share a categorical
+    # dtype (as produced by prepare_team_game_features), else the raw strings.
+    team_column = paired["TEAM_ABBREVIATION"]
+    opponent_column = paired["OPPONENT_ABBREVIATION"]
+    if (
+        isinstance(team_column.dtype, pd.CategoricalDtype)
+        and team_column.dtype == opponent_column.dtype
+    ):
+        teams = team_column.cat.codes.to_numpy().reshape(-1, 2)
+        opponents = opponent_column.cat.codes.to_numpy().reshape(-1, 2)
+    else:
+        teams = team_column.to_numpy(dtype=object).reshape(-1, 2)
+        opponents = opponent_column.to_numpy(dtype=object).reshape(-1, 2)
+    consistent = (teams[:, 0] == opponents[:, 1]) & (teams[:, 1] == opponents[:, 0])
+    paired = paired[np.repeat(consistent, 2)]
 
-    merged = df.merge(
-        opponent_df,
-        on=["GAME_ID", "TEAM_ABBREVIATION", "OPPONENT_ABBREVIATION"],
-        suffixes=("", "_OPP"),
-    )
+    n_features = len(feature_columns)
+    values = paired.loc[:, list(feature_columns)].to_numpy().reshape(-1, 2, n_features)
+    first, second = values[:, 0, :], values[:, 1, :]
+    diffs = np.stack([first - second, second - first], axis=1).reshape(-1, n_features)
 
-    diff_feature_columns: List[str] = []
-    for column in feature_columns:
-        diff_column = f"{column}_DIFF"
-        merged[diff_column] = merged[column] - merged[f"{column}_OPP"]
-        diff_feature_columns.append(diff_column)
+    diff_feature_columns: List[str] = [f"{column}_DIFF" for column in feature_columns]
 
-    modelling_columns = [
+    metadata_columns = [
         "GAME_ID",
         "GAME_DATE",
         "TEAM_ABBREVIATION",
         "OPPONENT_ABBREVIATION",
         "HOME",
         "WIN",
-        *diff_feature_columns,
     ]
 
-    matchup_df = merged[modelling_columns].copy()
-    matchup_df["HOME"] = matchup_df["HOME"].astype(int)
+    # The diff block is wrapped without copying and only the (small) metadata
+    # selection is materialised; HOME is cast before joining the two so the
+    # combined frame never needs a defensive copy.
+    metadata = paired[metadata_columns].reset_index(drop=True)
+    metadata["HOME"] = metadata["HOME"].to_numpy().astype(np.int8, copy=False)
+    matchup_df = pd.concat(
+        [metadata, pd.DataFrame(diffs, columns=diff_feature_columns, copy=False)],
+        axis=1,
+        copy=False,
+    )
 
     return matchup_df, tuple(diff_feature_columns)
 
@@ -253,16 +350,15 @@ def compute_team_season_averages(
     df = team_games.data
     feature_columns = list(team_games.feature_columns)
 
-    grouped = df.groupby("TEAM_ABBREVIATION")
-
     if weight_by_minutes and "MIN" in feature_columns:
-        def weighted_mean(group):
-            weights = group["MIN"].clip(lower=1)
-            weighted = group[feature_columns].mul(weights, axis=0)
-            return weighted.sum() / weights.sum()
-
-        season_averages = grouped.apply(weighted_mean)
+        # sum(w * x) / sum(w) per team, computed with a single groupby-sum.
+        weights = df["MIN"].clip(lower=1)
+        weighted = df[feature_columns].mul(weights, axis=0)
+        weighted["_WEIGHT"] = weights
+        totals = weighted.groupby(df["TEAM_ABBREVIATION"], observed=True).sum()
+        season_averages = totals[feature_columns].div(totals["_WEIGHT"], axis=0)
     else:
+        grouped = df.groupby("TEAM_ABBREVIATION", observed=True)
         season_averages = grouped[feature_columns].mean()
 
     season_averages.sort_index(inplace=True)
@@ -298,40 +394,28 @@ def build_season_matchup_frame(
             "Season averages missing for teams: " + ", ".join(sorted(missing))
         )
 
-    league_average = season_averages[base_features].mean()
+    league_average = season_averages[base_features].mean().to_numpy(dtype=np.float32)
     fallback_teams: set[str] = set()
 
-    def resolve_vector(name: str) -> pd.Series:
+    def resolve_vector(name: str) -> np.ndarray:
         if name in available_teams:
-            return season_averages.loc[name, base_features]
+            return season_averages.loc[name, base_features].to_numpy(dtype=np.float32)
 
         fallback_teams.add(name)
         return league_average
 
-    team_vector = resolve_vector(team)
-    opponent_vector = resolve_vector(opponent)
+    diffs = resolve_vector(team) - resolve_vector(opponent)
 
-    data = {
-        diff_column: team_vector[base] - opponent_vector[base]
-        for diff_column, base in zip(diff_feature_columns, base_features)
+    frame = pd.DataFrame(diffs.reshape(1, -1), columns=list(diff_feature_columns))
+    metadata = {
+        "GAME_ID": "SEASON_AVG",
+        "GAME_DATE": pd.Timestamp.utcnow(),
+        "TEAM_ABBREVIATION": team,
+        "OPPONENT_ABBREVIATION": opponent,
+        "HOME": np.int8(home),
+        "WIN": 0,  # placeholder target column for API consistency
     }
-    data["HOME"] = int(home)
-    data["WIN"] = 0  # placeholder target column for API consistency
-    data["GAME_ID"] = "SEASON_AVG"
-    data["GAME_DATE"] = pd.Timestamp.utcnow()
-    data["TEAM_ABBREVIATION"] = team
-    data["OPPONENT_ABBREVIATION"] = opponent
-
-    columns = [
-        "GAME_ID",
-        "GAME_DATE",
-        "TEAM_ABBREVIATION",
-        "OPPONENT_ABBREVIATION",
-        "HOME",
-        "WIN",
-        *diff_feature_columns,
-    ]
-
-    frame = pd.DataFrame([data], columns=columns)
+    for position, (column, value) in enumerate(metadata.items()):
+        frame.insert(position, column, value)
     frame.attrs["fallback_teams"] = fallback_teams
     return frame
@@ -4,6 +4,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from . import data as data_utils
@@ -16,7 +17,7 @@ def parse_arguments() -> argparse.Namespace:
         "--data",
         type=Path,
         default=Path("csv/player_game_logs_2022.csv"),
-        help="Path to the CSV file containing player game logs.",
+        help="Path to the CSV (or Parquet) file containing player game logs.",
     )
     parser.add_argument(
         "--team",
@@ -54,9 +55,35 @@ def parse_arguments() -> argparse.Namespace:
 
 
 def chronological_split(df: pd.DataFrame, test_size: float) -> tuple[pd.DataFrame, pd.DataFrame]:
-    df = df.sort_values("GAME_DATE").reset_index(drop=True)
+    # Locate the boundary date with a linear-time selection instead of sorting
+    # the whole frame, and keep every row of a date on one side, which also
+    # keeps both sides of a matchup together.
     split_index = int(len(df) * (1 - test_size))
-    return df.iloc[:split_index], df.iloc[split_index:]
+    if split_index >= len(df):
+        return df, df.iloc[:0]
+    if split_index <= 0:
+        return df.iloc[:0], df
+    dates = df["GAME_DATE"].to_numpy()
+    boundary = np.partition(dates, split_index)[split_index]
+
+    # The boundary date goes to test unless putting it in train lands closer
+    # to the requested sizes. The whole-date split is kept only if both sides
+    # are non-empty and the test size is off by at most half; otherwise fall
+    # back to a plain positional split.
+    before = dates < boundary
+    through = dates <= boundary
+    rows_before = int(np.count_nonzero(before))
+    rows_through = int(np.count_nonzero(through))
+    if split_index - rows_before <= rows_through - split_index:
+        is_train, train_rows = before, rows_before
+    else:
+        is_train, train_rows = through, rows_through
+    tolerance = (len(df) - split_index) // 2
+    if 0 < train_rows < len(df) and abs(train_rows - split_index) <= tolerance:
+        return df[is_train], df[~is_train]
+
+    ordered = df.sort_values("GAME_DATE", kind="stable")
+    return ordered.iloc[:split_index], ordered.iloc[split_index:]
 
 
 def main() -> None:
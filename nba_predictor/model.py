@@ -2,14 +2,64 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Mapping, Sequence
+from functools import lru_cache
+from typing import Callable, Mapping, Optional, Sequence
 
 import numpy as np
 import pandas as pd
+from scipy.special import expit
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, log_loss, roc_auc_score
 from sklearn.preprocessing import StandardScaler
 
+# Numba is optional and only imported for frames this large. The kernel saves
+# ~0.2 s per million rows over the NumPy path, while importing Numba and
+# loading the kernel from its on-disk cache costs ~0.25 s (~2 s to compile
+# cold), so it only pays off on multi-million-row inputs.
+_JIT_MIN_ROWS = 2_000_000
+
+
+def _top_contribution_indices(contributions: np.ndarray, top_n: int) -> np.ndarray:
+    """Return per-row column indices of the ``top_n`` largest |contributions|.
+
+    Ties are broken by the lowest column index, matching the Numba kernel.
+    """
+
+    magnitudes = np.abs(contributions)
+    order = np.argsort(-magnitudes, axis=1, kind="stable")
+    return order[:, :top_n]
+
+
+@lru_cache(maxsize=None)
+def _top_contribution_indices_jit() -> Optional[
+    Callable[[np.ndarray, int], np.ndarray]
+]:
+    """Compile the Numba ranking kernel on first use, or return ``None``."""
+
+    try:
+        from numba import njit, prange
+    except ImportError:  # pragma: no cover - depends on the environment
+        return None
+
+    @njit(parallel=True, cache=True)
+    def kernel(contributions, top_n):  # pragma: no cover
+        n_rows, n_columns = contributions.shape
+        result = np.empty((n_rows, top_n), dtype=np.intp)
+        for row in prange(n_rows):
+            magnitudes = np.abs(contributions[row])
+            for slot in range(top_n):
+                best = 0
+                best_value = -1.0
+                for column in range(n_columns):
+                    if magnitudes[column] > best_value:
+                        best = column
+                        best_value = magnitudes[column]
+                result[row, slot] = best
+                magnitudes[best] = -1.0
+        return result
+
+    return kernel
+
 
 @dataclass
 class EvaluationResult:
@@ -38,6 +88,19 @@ class MatchupPredictor:
         self.feature_columns: Sequence[str] | None = feature_columns
         self.model = model or LogisticRegression(max_iter=1000)
         self.scaler = StandardScaler()
+        self._mean: np.ndarray | None = None
+        self._inv_scale: np.ndarray | None = None
+        self._coef: np.ndarray | None = None
+        self._intercept = 0.0
+
+    def _feature_matrix(self, dataframe: pd.DataFrame) -> np.ndarray:
+        """Return the feature block as a fresh float32 array with NaNs zeroed."""
+
+        features = dataframe.loc[:, self.feature_columns].to_numpy(
+            dtype=np.float32, copy=True
+        )
+        np.copyto(features, 0.0, where=np.isnan(features))
+        return features
 
     def _prepare_features(self, dataframe: pd.DataFrame) -> np.ndarray:
         if not self.feature_columns:
@@ -47,24 +110,44 @@ class MatchupPredictor:
             raise KeyError(
                 "Missing required feature columns: " + ", ".join(sorted(missing))
             )
-        features = dataframe.loc[:, self.feature_columns].fillna(0.0)
-        return self.scaler.transform(features)
+        if self._mean is None or self._inv_scale is None:
+            raise ValueError("Predictor has not been fitted. Call `fit` first.")
+        # Apply the fitted scaler parameters in place on a single buffer rather
+        # than going through StandardScaler.transform's validation and copies.
+        features = self._feature_matrix(dataframe)
+        np.subtract(features, self._mean, out=features)
+        np.multiply(features, self._inv_scale, out=features)
+        return features
 
     def fit(self, dataframe: pd.DataFrame, feature_columns: Sequence[str]) -> "MatchupPredictor":
         """Fit the underlying model using the provided matchup dataframe."""
 
         self.feature_columns = tuple(feature_columns)
-        features = dataframe.loc[:, self.feature_columns].fillna(0.0)
-        targets = dataframe["WIN"].astype(int)
+        features = self._feature_matrix(dataframe)
+        targets = dataframe["WIN"].to_numpy(dtype=np.int8)
 
         scaled_features = self.scaler.fit_transform(features)
+        self._mean = self.scaler.mean_.astype(np.float32)
+        self._inv_scale = (1.0 / self.scaler.scale_).astype(np.float32)
         self.model.fit(scaled_features, targets)
+
+        # Binary logistic regression only needs the positive-class logit, so
+        # keep the weights around to score rows without sklearn's dispatch.
+        if isinstance(self.model, LogisticRegression) and self.model.coef_.shape[0] == 1:
+            self._coef = self.model.coef_.ravel().astype(np.float32)
+            self._intercept = float(self.model.intercept_[0])
+        else:
+            self._coef = None
         return self
 
     def predict_proba(self, dataframe: pd.DataFrame) -> pd.Series:
         """Return win probability estimates for each row in ``dataframe``."""
 
-        probabilities = self.model.predict_proba(self._prepare_features(dataframe))[:, 1]
+        features = self._prepare_features(dataframe)
+        if self._coef is not None:
+            probabilities = expit(features @ self._coef + self._intercept)
+        else:
+            probabilities = self.model.predict_proba(features)[:, 1]
         return pd.Series(probabilities, index=dataframe.index, name="win_probability")
 
     def predict(self, dataframe: pd.DataFrame, threshold: float = 0.5) -> pd.Series:
@@ -102,15 +185,26 @@ class MatchupPredictor:
 
         coefs = self.model.coef_.ravel()
         probabilities = self.predict_proba(dataframe)
-        feature_values = dataframe.loc[:, self.feature_columns].fillna(0.0)
-
+        contributions = self._feature_matrix(dataframe) * coefs
+        top_n = max(0, min(top_n, contributions.shape[1]))
+        kernel = None
+        if len(contributions) >= _JIT_MIN_ROWS:
+            kernel = _top_contribution_indices_jit()
+        if kernel is not None:
+            top_indices = kernel(contributions, top_n)
+        else:
+            top_indices = _top_contribution_indices(contributions, top_n)
+        top_contributions = np.take_along_axis(contributions, top_indices, axis=1)
+
+        feature_names = np.asarray(self.feature_columns, dtype=object)
         explanations = []
-        for row_index, (row, probability) in enumerate(zip(feature_values.values, probabilities)):
-            contributions = row * coefs
-            sorted_indices = np.argsort(-np.abs(contributions))[:top_n]
-            explanation = {
-                self.feature_columns[i]: float(contributions[i]) for i in sorted_indices
-            }
-            explanation["probability"] = float(probability)
+        rows = zip(
+            feature_names[top_indices],
+            top_contributions.tolist(),
+            probabilities.tolist(),
+        )
+        for names, values, probability in rows:
+            explanation = dict(zip(names, values))
+            explanation["probability"] = probability
             explanations.append(explanation)
         return explanations
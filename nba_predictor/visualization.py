@@ -3,13 +3,18 @@ from __future__ import annotations
 
 import argparse
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple
 
-import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+import numpy as np
 import pandas as pd
+from PIL import Image
 
 from .data import TeamGameFeatures, load_player_logs, prepare_team_game_features
 
@@ -17,88 +22,151 @@ from .data import TeamGameFeatures, load_player_logs, prepare_team_game_features
 def _attach_opponent_points(team_games: pd.DataFrame) -> pd.DataFrame:
     """Add opponent points for each team game."""
 
-    opponent_points = (
-        team_games[["GAME_ID", "TEAM_ABBREVIATION", "PTS"]]
-        .rename(
-            columns={
-                "TEAM_ABBREVIATION": "OPPONENT_ABBREVIATION",
-                "PTS": "OPP_POINTS",
-            }
-        )
-        .copy()
+    # The projection is only read by the merge, which builds a new frame, so
+    # it is not copied first.
+    opponent_points = team_games[["GAME_ID", "TEAM_ABBREVIATION", "PTS"]].rename(
+        columns={
+            "TEAM_ABBREVIATION": "OPPONENT_ABBREVIATION",
+            "PTS": "OPP_POINTS",
+        }
     )
 
+    # An inner join drops games without opponent data in the same pass, so no
+    # separate dropna/copy is needed before deriving the differential.
     enriched = team_games.merge(
         opponent_points,
         on=["GAME_ID", "OPPONENT_ABBREVIATION"],
-        how="left",
-        validate="many_to_one",
+        how="inner",
     )
-    enriched = enriched.dropna(subset=["OPP_POINTS"]).copy()
-    enriched["OPP_POINTS"] = enriched["OPP_POINTS"].astype(float)
-    enriched["POINT_DIFFERENTIAL"] = enriched["PTS"] - enriched["OPP_POINTS"]
+    # Keep the float32 precision of the team features: point totals are exact
+    # in float32 and the summaries only average these columns.
+    points = enriched["PTS"].to_numpy(dtype=np.float32)
+    points_allowed = enriched["OPP_POINTS"].to_numpy(dtype=np.float32)
+    enriched["OPP_POINTS"] = points_allowed
+    enriched["POINT_DIFFERENTIAL"] = points - points_allowed
     return enriched
 
 
 def compute_team_summaries(team_games: pd.DataFrame) -> pd.DataFrame:
     """Compute per-team summary statistics from team game data."""
 
-    team_summary = (
-        team_games.groupby("TEAM_ABBREVIATION")
-        .agg(
-            games_played=("GAME_ID", "nunique"),
-            avg_points=("PTS", "mean"),
-            avg_points_allowed=("OPP_POINTS", "mean"),
-            avg_point_diff=("POINT_DIFFERENTIAL", "mean"),
-            avg_rebounds=("REB", "mean"),
-            avg_assists=("AST", "mean"),
-            avg_turnovers=("TOV", "mean"),
-            win_rate=("WIN", "mean"),
-        )
-        .sort_values("avg_point_diff", ascending=False)
+    mean_columns = {
+        "PTS": "avg_points",
+        "OPP_POINTS": "avg_points_allowed",
+        "POINT_DIFFERENTIAL": "avg_point_diff",
+        "REB": "avg_rebounds",
+        "AST": "avg_assists",
+        "TOV": "avg_turnovers",
+        "WIN": "win_rate",
+    }
+
+    # All averages come from one block-wise mean over the selected columns
+    # instead of a separate aggregation per output column.
+    grouped = team_games.groupby("TEAM_ABBREVIATION", sort=False, observed=True)
+    team_summary = grouped[list(mean_columns)].mean().rename(columns=mean_columns)
+    team_summary.insert(0, "games_played", grouped["GAME_ID"].nunique())
+    # Groups come back in encounter order, so ties are broken by team name to
+    # keep the ranking deterministic.
+    team_summary = team_summary.sort_values(
+        ["avg_point_diff", "TEAM_ABBREVIATION"], ascending=[False, True]
     )
     team_summary["net_rating"] = team_summary["avg_point_diff"]
-    turnovers = team_summary["avg_turnovers"].replace(0, pd.NA)
-    team_summary["assist_to_turnover"] = team_summary["avg_assists"] / turnovers
+    # Teams without turnovers get NaN rather than an infinite ratio.
+    assists = team_summary["avg_assists"].to_numpy()
+    turnovers = team_summary["avg_turnovers"].to_numpy()
+    ratio = np.full_like(assists, np.nan)
+    np.divide(assists, turnovers, out=ratio, where=turnovers != 0)
+    team_summary["assist_to_turnover"] = ratio
     return team_summary
 
 
 def compute_home_away_summary(team_games: pd.DataFrame) -> pd.DataFrame:
     """Compute win rates split by home/away."""
 
-    summary = (
-        team_games.groupby(["TEAM_ABBREVIATION", "HOME"])
-        .agg(win_rate=("WIN", "mean"), games=("GAME_ID", "nunique"))
-        .reset_index()
+    # Two masked means build the home and away columns directly, instead of a
+    # long (team, home) aggregation that then has to be reset and pivoted.
+    home_mask = team_games["HOME"].eq(1).to_numpy()
+    pivot = pd.concat(
+        [
+            team_games.loc[~home_mask]
+            .groupby("TEAM_ABBREVIATION", sort=False, observed=True)["WIN"]
+            .mean()
+            .rename("away_win_rate"),
+            team_games.loc[home_mask]
+            .groupby("TEAM_ABBREVIATION", sort=False, observed=True)["WIN"]
+            .mean()
+            .rename("home_win_rate"),
+        ],
+        axis=1,
     )
-    pivot = summary.pivot(
-        index="TEAM_ABBREVIATION", columns="HOME", values="win_rate"
-    ).rename(columns={False: "away_win_rate", True: "home_win_rate"})
     pivot["home_court_edge"] = pivot["home_win_rate"] - pivot["away_win_rate"]
-    return pivot.sort_values("home_court_edge", ascending=False)
+    return pivot.sort_values(
+        ["home_court_edge", "TEAM_ABBREVIATION"], ascending=[False, True]
+    )
 
 
 def compute_player_scoring(player_logs: pd.DataFrame, top_n: int = 12) -> pd.DataFrame:
     """Return the top N scorers by average points per game."""
 
+    # Most common team per player: count (player, team) pairs once and keep the
+    # largest count per player. Ties resolve to the alphabetically first team,
+    # matching Series.mode ordering.
+    team_counts = (
+        player_logs.groupby(
+            ["PLAYER_NAME", "TEAM_ABBREVIATION"], sort=False, observed=True
+        )
+        .size()
+        .reset_index(name="games")
+        .sort_values(["games", "TEAM_ABBREVIATION"], ascending=[False, True])
+        .drop_duplicates("PLAYER_NAME")
+    )
+    primary_team = team_counts.set_index("PLAYER_NAME")["TEAM_ABBREVIATION"]
+
     scoring = (
-        player_logs.groupby("PLAYER_NAME")
+        player_logs.groupby("PLAYER_NAME", sort=False, observed=True)
         .agg(
             avg_points=("PTS", "mean"),
             avg_minutes=("MIN", "mean"),
             games_played=("GAME_ID", "nunique"),
-            team=("TEAM_ABBREVIATION", lambda x: x.mode().iat[0] if not x.mode().empty else ""),
         )
         .query("games_played >= 10")
-        .sort_values("avg_points", ascending=False)
-        .head(top_n)
+        .nlargest(top_n, "avg_points")
     )
+    scoring["team"] = primary_team.reindex(scoring.index).fillna("")
     scoring["label"] = scoring.index + " (" + scoring["team"] + ")"
     return scoring
 
 
-def create_offense_defense_plot(team_summary: pd.DataFrame, output_path: Path) -> None:
-    fig, ax = plt.subplots(figsize=(10, 7))
+# The PNGs are intermediate artifacts that get decoded again for the PDF, so
+# favour encode speed over file size.
+_PNG_PIL_KWARGS = {"compress_level": 1}
+
+
+def _chart_figure() -> Figure:
+    """Return a new, pyplot-independent figure sized for the exploratory charts."""
+
+    return Figure(figsize=(10, 7))
+
+
+def _chart_axes(fig: Optional[Figure]) -> Tuple[Figure, Axes]:
+    """Return a figure and fresh axes for the next exploratory chart.
+
+    All charts share the same size, so a caller drawing a batch of them can
+    pass one figure to be cleared and reused instead of building a new one per
+    plot. Without a figure a new one is created for this chart alone.
+    """
+
+    if fig is None:
+        fig = _chart_figure()
+    else:
+        fig.clear()
+    return fig, fig.add_subplot()
+
+
+def create_offense_defense_plot(
+    team_summary: pd.DataFrame, output_path: Path, fig: Optional[Figure] = None
+) -> None:
+    fig, ax = _chart_axes(fig)
     scatter = ax.scatter(
         team_summary["avg_points"],
         team_summary["avg_points_allowed"],
@@ -108,10 +176,14 @@ def create_offense_defense_plot(team_summary: pd.DataFrame, output_path: Path) -
         edgecolors="black",
         linewidths=0.5,
     )
-    for team, row in team_summary.iterrows():
+    for team, x, y in zip(
+        team_summary.index.to_numpy(),
+        team_summary["avg_points"].to_numpy(),
+        team_summary["avg_points_allowed"].to_numpy(),
+    ):
         ax.annotate(
             team,
-            (row["avg_points"], row["avg_points_allowed"]),
+            (x, y),
             textcoords="offset points",
             xytext=(5, -5),
             fontsize=8,
@@ -123,24 +195,26 @@ def create_offense_defense_plot(team_summary: pd.DataFrame, output_path: Path) -
     colorbar.set_label("Net rating (points per game differential)")
     ax.invert_yaxis()
     fig.tight_layout()
-    fig.savefig(output_path, dpi=150)
-    plt.close(fig)
+    fig.savefig(output_path, dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
 
 
-def create_home_court_plot(home_away: pd.DataFrame, output_path: Path) -> None:
-    fig, ax = plt.subplots(figsize=(10, 7))
+def create_home_court_plot(
+    home_away: pd.DataFrame, output_path: Path, fig: Optional[Figure] = None
+) -> None:
+    fig, ax = _chart_axes(fig)
     teams = home_away.index
     ax.barh(teams, home_away["home_court_edge"], color="#1f77b4")
     ax.set_xlabel("Home win rate - Away win rate")
     ax.set_title("Home court advantage by team")
     ax.axvline(0, color="black", linewidth=0.8)
     fig.tight_layout()
-    fig.savefig(output_path, dpi=150)
-    plt.close(fig)
+    fig.savefig(output_path, dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
 
 
-def create_player_scoring_plot(player_scoring: pd.DataFrame, output_path: Path) -> None:
-    fig, ax = plt.subplots(figsize=(10, 7))
+def create_player_scoring_plot(
+    player_scoring: pd.DataFrame, output_path: Path, fig: Optional[Figure] = None
+) -> None:
+    fig, ax = _chart_axes(fig)
     ax.barh(
         player_scoring["label"],
         player_scoring["avg_points"],
@@ -153,12 +227,13 @@ def create_player_scoring_plot(player_scoring: pd.DataFrame, output_path: Path)
     for index, value in enumerate(player_scoring["avg_points"]):
         ax.text(value + 0.2, index, f"{value:.1f} ppg", va="center", fontsize=8)
     fig.tight_layout()
-    fig.savefig(output_path, dpi=150)
-    plt.close(fig)
+    fig.savefig(output_path, dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
 
 
-def create_assist_turnover_plot(team_summary: pd.DataFrame, output_path: Path) -> None:
-    fig, ax = plt.subplots(figsize=(10, 7))
+def create_assist_turnover_plot(
+    team_summary: pd.DataFrame, output_path: Path, fig: Optional[Figure] = None
+) -> None:
+    fig, ax = _chart_axes(fig)
     ax.scatter(
         team_summary["avg_assists"],
         team_summary["avg_turnovers"],
@@ -168,10 +243,14 @@ def create_assist_turnover_plot(team_summary: pd.DataFrame, output_path: Path) -
         edgecolors="black",
         linewidths=0.5,
     )
-    for team, row in team_summary.iterrows():
+    for team, x, y in zip(
+        team_summary.index.to_numpy(),
+        team_summary["avg_assists"].to_numpy(),
+        team_summary["avg_turnovers"].to_numpy(),
+    ):
         ax.annotate(
             team,
-            (row["avg_assists"], row["avg_turnovers"]),
+            (x, y),
             textcoords="offset points",
             xytext=(5, -5),
             fontsize=8,
@@ -179,11 +258,33 @@ def create_assist_turnover_plot(team_summary: pd.DataFrame, output_path: Path) -
     ax.set_xlabel("Average assists")
     ax.set_ylabel("Average turnovers")
     ax.set_title("Ball movement vs. ball security")
-    colorbar = plt.colorbar(ax.collections[0], ax=ax)
+    colorbar = fig.colorbar(ax.collections[0], ax=ax)
     colorbar.set_label("Assist-to-turnover ratio")
     fig.tight_layout()
-    fig.savefig(output_path, dpi=150)
-    plt.close(fig)
+    fig.savefig(output_path, dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
+
+
+_BULLET_WRAPPER = textwrap.TextWrapper(width=85)
+_PARAGRAPH_WRAPPER = textwrap.TextWrapper(width=90)
+
+
+def _draw_text_block(
+    fig: Figure, x: float, y: float, lines: List[str], fontsize: int, step: float
+) -> None:
+    """Draw ``lines`` as one multi-line text artist.
+
+    The first baseline sits at ``y`` and consecutive baselines are ``step``
+    figure-fractions apart, matching one ``fig.text`` call per line.
+    """
+
+    if not lines:
+        return
+    linespacing = step * fig.get_figheight() * 72 / fontsize
+    # A multi-line baseline-aligned text anchors on its last line.
+    last_baseline = y - step * (len(lines) - 1)
+    fig.text(
+        x, last_baseline, "\n".join(lines), fontsize=fontsize, linespacing=linespacing
+    )
 
 
 def _render_story_to_pdf(story_path: Path, pdf: PdfPages) -> None:
@@ -238,17 +339,17 @@ def _render_story_to_pdf(story_path: Path, pdf: PdfPages) -> None:
             y -= delta
         elif stripped.startswith("* "):
             bullet = stripped[2:].strip()
-            wrapped = textwrap.wrap(bullet, width=85)
-            for i, segment in enumerate(wrapped):
-                prefix = "• " if i == 0 else "  "
-                fig.text(0.07, y, prefix + segment, fontsize=11)
-                y -= 0.032
+            wrapped = [
+                ("• " if i == 0 else "  ") + segment
+                for i, segment in enumerate(_BULLET_WRAPPER.wrap(bullet))
+            ]
+            _draw_text_block(fig, 0.07, y, wrapped, fontsize=11, step=0.032)
+            y -= 0.032 * len(wrapped)
             y -= 0.008
         else:
-            wrapped = textwrap.wrap(stripped, width=90)
-            for segment in wrapped:
-                fig.text(0.05, y, segment, fontsize=12)
-                y -= 0.035
+            wrapped = _PARAGRAPH_WRAPPER.wrap(stripped)
+            _draw_text_block(fig, 0.05, y, wrapped, fontsize=12, step=0.035)
+            y -= 0.035 * len(wrapped)
             y -= 0.01
 
         if y < 0.12:
@@ -266,8 +367,11 @@ def _embed_charts_in_pdf(chart_paths: Iterable[Path], pdf: PdfPages) -> None:
         fig = plt.figure(figsize=(11, 8.5))
         fig.patch.set_facecolor("white")
         ax = fig.add_subplot(111)
-        image = mpimg.imread(chart_path)
-        ax.imshow(image)
+        # Keep the decoded PNG as uint8 and let the PDF backend embed it at its
+        # native resolution instead of resampling a float RGBA copy.
+        with Image.open(chart_path) as image:
+            pixels = np.asarray(image)
+        ax.imshow(pixels, interpolation="none")
         ax.axis("off")
         fig.suptitle(chart_path.stem.replace("_", " ").title(), fontsize=16, y=0.98)
         pdf.savefig(fig)
@@ -315,20 +419,125 @@ def _create_pdf_summary(
             _render_story_to_pdf(story_path, pdf)
 
 
+def _render_charts(
+    jobs: Iterable[Tuple[Callable[..., None], pd.DataFrame, Path]],
+    max_workers: Optional[int] = None,
+) -> None:
+    """Render each ``(plot_function, frame, output_path)`` job.
+
+    Charts are independent, so with ``max_workers`` above one they are drawn in
+    separate processes. Serial rendering remains the default because process
+    start-up outweighs the gain for four small charts on few cores.
+    """
+
+    if max_workers is None or max_workers <= 1:
+        # One figure is shared by this batch and released when it is done.
+        fig = _chart_figure()
+        for plot, frame, output_path in jobs:
+            plot(frame, output_path, fig=fig)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(plot, frame, output_path)
+            for plot, frame, output_path in jobs
+        ]
+        for future in futures:
+            future.result()
+
+
+# Bump whenever ``load_player_logs`` changes the columns or dtypes it returns,
+# so caches written by an older loader are rebuilt instead of served.
+_PLAYER_LOG_CACHE_VERSION = 1
+
+
+def _load_player_logs_cached(player_logs_path: Path) -> pd.DataFrame:
+    """Load player logs, reusing a Parquet copy of a CSV export when possible.
+
+    The parsed frame is written next to the CSV as ``<name>.cache.parquet``
+    together with the loader version and the CSV's size and modification time,
+    and read back on later runs only while all three still match. Without a
+    Parquet engine the CSV is simply parsed every time.
+    """
+
+    if player_logs_path.suffix == ".parquet":
+        return load_player_logs(player_logs_path)
+
+    source = player_logs_path.stat()
+    stamp = {
+        "version": _PLAYER_LOG_CACHE_VERSION,
+        "size": source.st_size,
+        "mtime_ns": source.st_mtime_ns,
+    }
+    cache_path = player_logs_path.with_suffix(".cache.parquet")
+    try:
+        cached = pd.read_parquet(cache_path)
+    except (ImportError, OSError, ValueError):
+        # Missing, stale-engine or unreadable cache: fall back to the CSV.
+        pass
+    else:
+        if cached.attrs.pop("player_log_cache", None) == stamp:
+            return cached
+
+    player_logs = load_player_logs(player_logs_path)
+    # DataFrame.attrs is stored in the Parquet metadata and restored on read.
+    player_logs.attrs["player_log_cache"] = stamp
+    try:
+        player_logs.to_parquet(cache_path, index=False, compression="zstd")
+    except (ImportError, OSError):
+        pass
+    finally:
+        del player_logs.attrs["player_log_cache"]
+    return player_logs
+
+
+@lru_cache(maxsize=4)
+def _summaries_for(
+    player_logs_path: Path, size: int, mtime_ns: int, top_players: int
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    # ``size`` and ``mtime_ns`` are only part of the cache key, matching the
+    # stamp of the Parquet cache, so replacing the file on disk invalidates the
+    # cached summaries even if its modification time was preserved.
+    player_logs = _load_player_logs_cached(player_logs_path)
+    team_features: TeamGameFeatures = prepare_team_game_features(player_logs)
+    team_games = _attach_opponent_points(team_features.data)
+
+    return (
+        compute_team_summaries(team_games),
+        compute_home_away_summary(team_games),
+        compute_player_scoring(player_logs, top_players),
+    )
+
+
+def _load_and_prepare(
+    player_logs_path: Path, top_players: int
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Return the team, home/away and scorer summaries for a player log file.
+
+    Results are memoized per resolved path, file size and modification time,
+    so repeated calls in one session (e.g. from a notebook) skip loading and
+    aggregating unchanged data. The returned frames are shared and must not be
+    modified.
+    """
+
+    resolved = Path(player_logs_path).resolve()
+    source = resolved.stat()
+    return _summaries_for(
+        resolved, source.st_size, source.st_mtime_ns, top_players
+    )
+
+
 def generate_visualizations(
     player_logs_path: Path,
     output_dir: Path,
     top_players: int,
     story_path: Optional[Path] = None,
     pdf_path: Optional[Path] = None,
+    max_workers: Optional[int] = None,
 ) -> Tuple[Path, ...]:
-    player_logs = load_player_logs(player_logs_path)
-    team_features: TeamGameFeatures = prepare_team_game_features(player_logs)
-    team_games = _attach_opponent_points(team_features.data)
-
-    team_summary = compute_team_summaries(team_games)
-    home_away = compute_home_away_summary(team_games)
-    player_scoring = compute_player_scoring(player_logs, top_players)
+    team_summary, home_away, player_scoring = _load_and_prepare(
+        player_logs_path, top_players
+    )
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -337,10 +546,15 @@ def generate_visualizations(
     scoring_path = output_dir / "top_scorers.png"
     assist_turnover_path = output_dir / "assist_turnover_balance.png"
 
-    create_offense_defense_plot(team_summary, offense_defense_path)
-    create_home_court_plot(home_away, home_court_path)
-    create_player_scoring_plot(player_scoring, scoring_path)
-    create_assist_turnover_plot(team_summary, assist_turnover_path)
+    _render_charts(
+        (
+            (create_offense_defense_plot, team_summary, offense_defense_path),
+            (create_home_court_plot, home_away, home_court_path),
+            (create_player_scoring_plot, player_scoring, scoring_path),
+            (create_assist_turnover_plot, team_summary, assist_turnover_path),
+        ),
+        max_workers,
+    )
 
     chart_paths = (
         offense_defense_path,
@@ -364,7 +578,7 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         "--player-logs",
         type=Path,
         required=True,
-        help="Path to the player logs CSV file",
+        help="Path to the player logs CSV (or Parquet) file",
     )
     parser.add_argument(
         "--output-dir",
@@ -395,6 +609,13 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         help="Optional path where a combined PDF summary (charts + story) will be saved.",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to render the charts in parallel",
+    )
+
     parsed_args = parser.parse_args(list(argv) if argv is not None else None)
 
     story_file = parsed_args.story_file
@@ -408,6 +629,7 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
         parsed_args.top_players,
         story_file,
         parsed_args.pdf,
+        parsed_args.workers,
     )
 
     print("Generated visualizations:")